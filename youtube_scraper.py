@@ -13,17 +13,26 @@ Example:
 """
 
 import argparse
+import base64
+import contextlib
 import csv
-import json
+import glob
+import http.client
 import os
+import queue
 import re
 import shutil
+import signal
+import sqlite3
 import subprocess
 import sys
+import tempfile
+import threading
 import urllib.parse
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
 
 class ChannelError(Exception):
@@ -35,16 +44,59 @@ class ChannelError(Exception):
 
 
 class YouTubeScraper:
+    YOUTUBE_HOST = 'www.youtube.com'
+    MAX_REDIRECTS = 5
+    # Concurrent watch page fetches, which is also the most connections pooled
+    MAX_WORKERS = 16
+    READ_CHUNK_SIZE = 64 * 1024
+    # Most of a page left after uploadDate that is still read so the connection
+    # can be reused; a longer remainder is cut off by closing the connection
+    MAX_DRAIN_BYTES = 64 * 1024
+    YTDLP_TIMEOUT = 60
+    # yt-dlp error messages that mean the channel is missing, or the network failed
+    _NOT_FOUND_RE = re.compile('|'.join(map(re.escape, [
+        'not found', 'does not exist', '404', 'channel not found',
+        'not available', 'private', 'does not have'
+    ])), re.IGNORECASE)
+    _NETWORK_RE = re.compile('|'.join(map(re.escape, [
+        'network', 'timeout', 'connection', 'resolve'
+    ])), re.IGNORECASE)
+    # Resolved yt-dlp path, shared by all instances
+    _ytdlp_path_cache: Optional[str] = None
+    # Only the fields we use, tab-separated, instead of a full JSON dump per video
+    _VIDEO_TEMPLATE = '%(id)s\t%(title)s\t%(view_count)s\t%(duration)s\t%(upload_date)s'
+
     def __init__(self):
         self.user_agent = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
+        # Idle keep-alive connections to youtube.com, shared by all fetches
+        self._idle_connections = queue.LifoQueue()
         # Set up output directory
         self.script_dir = Path(__file__).parent
         self.csv_dir = self.script_dir / "yt-csv"
         self.csv_dir.mkdir(exist_ok=True)
+        # Upload dates never change, so fetched ones are kept across runs
+        self._date_cache = self._open_date_cache()
         # Find yt-dlp executable
         self.ytdlp_path = self._find_ytdlp()
 
     def _find_ytdlp(self) -> str:
+        """
+        Find yt-dlp executable, reusing the path found by an earlier instance
+
+        Returns:
+            Path to yt-dlp executable
+
+        Raises:
+            FileNotFoundError: If yt-dlp is not found
+        """
+        cached = YouTubeScraper._ytdlp_path_cache
+        if cached and os.path.isfile(cached):
+            return cached
+
+        YouTubeScraper._ytdlp_path_cache = self._search_ytdlp()
+        return YouTubeScraper._ytdlp_path_cache
+
+    def _search_ytdlp(self) -> str:
         """
         Find yt-dlp executable across different platforms
 
@@ -76,7 +128,6 @@ class YouTubeScraper:
         for path in possible_paths:
             if '*' in path:
                 # Handle glob patterns for Windows
-                import glob
                 matches = glob.glob(path)
                 if matches:
                     path = matches[0]
@@ -85,6 +136,261 @@ class YouTubeScraper:
                 return path
 
         raise FileNotFoundError("找不到 yt-dlp 工具，請先安裝: pip3 install yt-dlp")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Close all pooled connections to youtube.com and the date cache"""
+        if self._date_cache:
+            self._date_cache.close()
+            self._date_cache = None
+        while True:
+            try:
+                conn = self._idle_connections.get_nowait()
+            except queue.Empty:
+                break
+            conn.close()
+
+    def _open_date_cache(self) -> Optional[sqlite3.Connection]:
+        """
+        Open the upload date cache in the yt-csv directory
+
+        Returns:
+            Cache connection, or None if the cache cannot be used (locked,
+            corrupt or read-only); scraping then works without it
+        """
+        try:
+            date_cache = sqlite3.connect(str(self.csv_dir / '.dates.db'))
+            date_cache.execute('CREATE TABLE IF NOT EXISTS d(id TEXT PRIMARY KEY, date TEXT)')
+            return date_cache
+        except sqlite3.Error as e:
+            print(f"無法使用首播日期快取，將直接查詢影片頁面: {e}")
+            return None
+
+    def _cached_date(self, video_id: str) -> Optional[str]:
+        """Look up a video's upload date in the date cache"""
+        if self._date_cache:
+            try:
+                row = self._date_cache.execute('SELECT date FROM d WHERE id = ?', (video_id,)).fetchone()
+                return row[0] if row else None
+            except sqlite3.Error as e:
+                self._drop_date_cache(e)
+        return None
+
+    def _store_date(self, video_id: str, upload_date: str):
+        """Add a video's upload date to the date cache (committed separately)"""
+        if self._date_cache:
+            try:
+                self._date_cache.execute('INSERT OR REPLACE INTO d(id, date) VALUES (?, ?)',
+                                         (video_id, upload_date))
+            except sqlite3.Error as e:
+                self._drop_date_cache(e)
+
+    def _commit_date_cache(self):
+        """Commit dates added to the date cache"""
+        if self._date_cache:
+            try:
+                self._date_cache.commit()
+            except sqlite3.Error as e:
+                self._drop_date_cache(e)
+
+    def _drop_date_cache(self, error: sqlite3.Error):
+        """Stop using the date cache for the rest of this run after an error"""
+        print(f"首播日期快取發生錯誤，本次執行將不再使用快取: {error}")
+        self._date_cache.close()
+        self._date_cache = None
+
+    def _fetch_page(self, path: str, stop_key: Optional[str] = None) -> str:
+        """
+        GET a page from youtube.com over a pooled keep-alive connection
+
+        Redirects are followed like urllib.request.urlopen does, e.g. to a
+        consent page.
+
+        Args:
+            path: Request path, e.g. /watch?v=<id>
+            stop_key: Stop downloading once this JSON key's non-empty string
+                value has been received (optional)
+
+        Returns:
+            Decoded HTML of the page, cut short after stop_key's value when found
+
+        Raises:
+            http.client.HTTPException: On a non-200 response or too many redirects
+            OSError: On network errors
+        """
+        host = self.YOUTUBE_HOST
+
+        for _ in range(self.MAX_REDIRECTS + 1):
+            location, body = self._get(host, path, stop_key)
+            if location is None:
+                return body.decode('utf-8')
+
+            target = urllib.parse.urlsplit(urllib.parse.urljoin(f'https://{host}{path}', location))
+            if target.scheme != 'https':
+                raise http.client.HTTPException(f"不支援的重新導向: {location}")
+            host = target.netloc
+            path = urllib.parse.urlunsplit(('', '', target.path or '/', target.query, ''))
+
+        raise http.client.HTTPException("重新導向次數過多")
+
+    def _get(self, host: str, path: str, stop_key: Optional[str] = None) -> Tuple[Optional[str], bytes]:
+        """
+        Send one GET request, reusing a pooled connection for youtube.com
+
+        Args:
+            host: Host to request from
+            path: Request path
+            stop_key: JSON key whose value ends the download (optional)
+
+        Returns:
+            Redirect location (None if the response is not a redirect) and body
+
+        Raises:
+            http.client.HTTPException: On a response other than 200 or a redirect
+            OSError: On network errors
+        """
+        headers = {'User-Agent': self.user_agent}
+        pooled = host == self.YOUTUBE_HOST
+
+        # A pooled connection may have been dropped by the server while idle,
+        # so a disconnect on the first attempt is retried on a fresh one
+        for attempt in range(2):
+            conn = None
+            if pooled:
+                try:
+                    conn = self._idle_connections.get_nowait()
+                except queue.Empty:
+                    pass
+            conn = conn or self._connect(host)
+
+            try:
+                conn.request('GET', path, headers=headers)
+                response = conn.getresponse()
+                if response.status == 200:
+                    body, complete = self._read_until(response, stop_key)
+                else:
+                    body, complete = response.read(), True
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                conn.close()
+                if attempt:
+                    raise
+                continue
+            except Exception:
+                conn.close()
+                raise
+
+            # A connection with part of the body still unread cannot be reused
+            if pooled and complete and not response.will_close:
+                self._idle_connections.put(conn)
+            else:
+                conn.close()
+
+            location = response.getheader('Location')
+            if response.status in (301, 302, 303, 307, 308) and location:
+                return location, body
+            if response.status != 200:
+                raise http.client.HTTPException(f"HTTP {response.status} {response.reason}")
+
+            return None, body
+
+    def _read_until(self, response: http.client.HTTPResponse, stop_key: Optional[str]) -> Tuple[bytes, bool]:
+        """
+        Read a response body in chunks, stopping once stop_key's value is received
+
+        Args:
+            response: Response to read
+            stop_key: JSON key whose non-empty string value ends the read (optional)
+
+        Returns:
+            The body, or its beginning up to the closing quote of stop_key's
+            value, and whether the whole body was read
+        """
+        marker = f'"{stop_key}":"'.encode() if stop_key else None
+        body = bytearray()
+        search_from = 0
+
+        while True:
+            chunk = response.read(self.READ_CHUNK_SIZE)
+            if not chunk:
+                return bytes(body), True
+
+            body += chunk
+            if marker is None:
+                continue
+
+            while True:
+                index = body.find(marker, search_from)
+                if index < 0:
+                    # Keep enough overlap for a marker split across chunks
+                    search_from = max(search_from, len(body) - len(marker) + 1)
+                    break
+
+                value_start = index + len(marker)
+                value_end = body.find(b'"', value_start)
+                if value_end < 0:
+                    # The value continues in the next chunk
+                    search_from = index
+                    break
+                if value_end > value_start:
+                    # Cutting after an ASCII quote never splits a UTF-8 character
+                    return bytes(body[:value_end + 1]), self._drain(response)
+
+                # Empty value, look for a later one
+                search_from = value_end + 1
+
+    def _drain(self, response: http.client.HTTPResponse) -> bool:
+        """
+        Read and discard the rest of a response if it is at most MAX_DRAIN_BYTES
+
+        Args:
+            response: Partly read response
+
+        Returns:
+            Whether the whole response has now been read
+        """
+        # Content-Length tells up front when the rest is too long to bother
+        if response.length is not None and response.length > self.MAX_DRAIN_BYTES:
+            return False
+
+        remaining = self.MAX_DRAIN_BYTES
+        while remaining > 0:
+            chunk = response.read(min(self.READ_CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+
+        return response.isclosed()
+
+    def _connect(self, host: str) -> http.client.HTTPSConnection:
+        """
+        Create a connection to host, tunnelling through the HTTPS proxy from
+        the environment (HTTPS_PROXY / NO_PROXY) the way urllib does
+
+        Args:
+            host: Host to connect to
+
+        Returns:
+            Unopened HTTPS connection
+        """
+        proxy = urllib.request.getproxies().get('https')
+        if not proxy or urllib.request.proxy_bypass(host):
+            return http.client.HTTPSConnection(host, timeout=10)
+
+        proxy_url = urllib.parse.urlsplit(proxy if '://' in proxy else f'http://{proxy}')
+        tunnel_headers = {}
+        if proxy_url.username:
+            credentials = f"{urllib.parse.unquote(proxy_url.username)}:{urllib.parse.unquote(proxy_url.password or '')}"
+            tunnel_headers['Proxy-Authorization'] = 'Basic ' + base64.b64encode(credentials.encode()).decode('ascii')
+
+        default_port = 443 if proxy_url.scheme == 'https' else 80
+        conn = http.client.HTTPSConnection(proxy_url.hostname, proxy_url.port or default_port, timeout=10)
+        conn.set_tunnel(host, headers=tunnel_headers)
+        return conn
     
     def get_channel_videos(self, channel_url: str, count: int = 10) -> List[Dict]:
         """
@@ -104,39 +410,89 @@ class YouTubeScraper:
         print(f"獲取影片數量: {count}")
         
         videos_url = f"{channel_url}/videos"
-        cmd = [self.ytdlp_path, '--flat-playlist', '--print-json', videos_url]
+        cmd = [
+            self.ytdlp_path, '--flat-playlist', '--encoding', 'utf-8',
+            '--playlist-end', str(count),
+            '-O', self._VIDEO_TEMPLATE,
+            videos_url
+        ]
         
-        try:
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+        videos = []
+        has_output = False
+        
+        def handle_line(line: str):
+            nonlocal has_output
+            has_output = has_output or bool(line.strip())
+            video_data = self._parse_video_line(line)
+            if video_data:
+                videos.append(video_data)
+        
+        returncode, stderr = self._run_ytdlp(cmd, handle_line)
+        
+        if returncode != 0:
+            raise self._channel_error(stderr, channel_url)
             
-            if result.returncode != 0:
-                stderr = result.stderr.lower()
+        if not has_output:
+            raise ChannelError(f"頻道沒有任何影片或頻道不存在: {channel_url}", "no_videos")
+                    
+        if not videos:
+            raise ChannelError(f"無法解析頻道影片資料: {channel_url}", "parse_error")
+                    
+        print(f"成功獲取 {len(videos)} 部影片基本資訊")
+        return videos
+    
+    def _run_ytdlp(self, cmd: List[str], handle_line: Callable[[str], None],
+                   timeout: Optional[int] = None) -> Tuple[int, str]:
+        """
+        Run yt-dlp, passing each line of its output to handle_line as it is printed
+        
+        Args:
+            cmd: yt-dlp command line
+            handle_line: Called with every stdout line
+            timeout: Seconds before yt-dlp is killed (default: YTDLP_TIMEOUT)
+            
+        Returns:
+            yt-dlp's return code and stderr output
+            
+        Raises:
+            ChannelError: When yt-dlp times out or cannot be run
+        """
+        timeout = timeout or self.YTDLP_TIMEOUT
+        timed_out = threading.Event()
+        
+        try:
+            # stderr goes to a file so a chatty yt-dlp cannot block on a full pipe
+            # while we are still reading stdout. On POSIX yt-dlp gets its own
+            # session so it can be killed together with anything it started
+            with tempfile.TemporaryFile() as stderr_file, \
+                    subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr_file,
+                                     start_new_session=(os.name != 'nt')) as process:
+                def kill_on_timeout():
+                    timed_out.set()
+                    self._kill_process_tree(process)
                 
-                if any(phrase in stderr for phrase in ['not found', 'does not exist', '404', 'channel not found', 'not available', 'private', 'does not have']):
-                    raise ChannelError(f"頻道不存在或無法存取: {channel_url}", "not_found")
-                elif any(phrase in stderr for phrase in ['network', 'timeout', 'connection', 'resolve']):
-                    raise ChannelError("網路連線問題，請檢查網路設定", "network")
-                else:
-                    raise ChannelError(f"yt-dlp 執行失敗: {result.stderr.strip()}", "unknown")
+                timer = threading.Timer(timeout, kill_on_timeout)
+                timer.start()
+                try:
+                    # Read raw bytes and decode each line as UTF-8, which yt-dlp is
+                    # told to write, rather than the platform's locale encoding
+                    for line in process.stdout:
+                        handle_line(line.decode('utf-8', errors='replace'))
+                    returncode = process.wait()
+                finally:
+                    timer.cancel()
+                    # Interrupted while reading (e.g. Ctrl+C): yt-dlp is in its own
+                    # session and would not get the signal, so stop it here
+                    if process.poll() is None:
+                        self._kill_process_tree(process)
                 
-            lines = result.stdout.strip().split('\n')
-            if not lines or not any(line.strip() for line in lines):
-                raise ChannelError(f"頻道沒有任何影片或頻道不存在: {channel_url}", "no_videos")
+                if timed_out.is_set():
+                    raise subprocess.TimeoutExpired(cmd, timeout)
                 
-            videos = []
-            for line in lines[:count]:
-                if line.strip():
-                    try:
-                        video_data = json.loads(line)
-                        videos.append(video_data)
-                    except json.JSONDecodeError:
-                        continue
-                        
-            if not videos:
-                raise ChannelError(f"無法解析頻道影片資料: {channel_url}", "parse_error")
-                        
-            print(f"成功獲取 {len(videos)} 部影片基本資訊")
-            return videos
+                stderr_file.seek(0)
+                stderr = stderr_file.read().decode('utf-8', errors='replace')
+            
+            return returncode, stderr
             
         except subprocess.TimeoutExpired:
             raise ChannelError("請求超時，請檢查網路連線或稍後再試", "timeout")
@@ -145,6 +501,112 @@ class YouTubeScraper:
         except Exception as e:
             raise ChannelError(f"執行 yt-dlp 時發生未預期錯誤: {e}", "unknown")
     
+    def _channel_error(self, stderr: str, channel_url: str) -> ChannelError:
+        """
+        Classify a failed yt-dlp run by its error output
+        
+        Args:
+            stderr: yt-dlp's stderr output
+            channel_url: Channel URL(s) to mention in the message
+            
+        Returns:
+            ChannelError describing the failure
+        """
+        if self._NOT_FOUND_RE.search(stderr):
+            return ChannelError(f"頻道不存在或無法存取: {channel_url}", "not_found")
+        elif self._NETWORK_RE.search(stderr):
+            return ChannelError("網路連線問題，請檢查網路設定", "network")
+        else:
+            return ChannelError(f"yt-dlp 執行失敗: {stderr.strip()}", "unknown")
+    
+    @staticmethod
+    def _kill_process_tree(process: subprocess.Popen):
+        """
+        Kill a process and every process it started
+        
+        A wrapper or launcher (pip shims, the Windows yt-dlp.exe launcher) runs
+        yt-dlp as a child that also holds the output pipe, so killing only the
+        direct child would leave the pipe open and the read blocked.
+        
+        Args:
+            process: Process started with start_new_session=True on POSIX
+        """
+        try:
+            if os.name == 'nt':
+                subprocess.run(['taskkill', '/F', '/T', '/PID', str(process.pid)],
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            else:
+                os.killpg(process.pid, signal.SIGKILL)
+        except OSError:
+            # Already exited
+            pass
+    
+    @staticmethod
+    def _parse_video_line(line: str) -> Optional[Dict]:
+        """
+        Parse one line of yt-dlp output printed with _VIDEO_TEMPLATE
+
+        Args:
+            line: Tab-separated id, title, view count, duration and upload date
+
+        Returns:
+            Video dictionary, or None if the line is malformed
+        """
+        fields = line.rstrip('\r\n').split('\t')
+        if len(fields) < 5 or not fields[0]:
+            return None
+
+        def to_int(value: str) -> int:
+            # yt-dlp prints NA for missing fields
+            try:
+                return int(float(value))
+            except ValueError:
+                return 0
+
+        # yt-dlp gives YYYYMMDD when it knows the date
+        upload_date = fields[-1]
+        if len(upload_date) == 8 and upload_date.isdigit():
+            upload_date = f"{upload_date[:4]}-{upload_date[4:6]}-{upload_date[6:]}"
+        else:
+            upload_date = None
+
+        return {
+            'id': fields[0],
+            # Titles may themselves contain tabs
+            'title': '\t'.join(fields[1:-3]),
+            'view_count': to_int(fields[-3]),
+            'duration': to_int(fields[-2]),
+            'upload_date': upload_date
+        }
+
+    @staticmethod
+    def _find_json_string(html: str, key: str) -> Optional[str]:
+        """
+        Find the first non-empty "key":"value" pair in a page with plain string search
+
+        Args:
+            html: Page content
+            key: JSON key to look for
+
+        Returns:
+            The value, or None if the key is not present with a non-empty value
+        """
+        marker = f'"{key}":"'
+        start = html.find(marker)
+
+        while start >= 0:
+            start += len(marker)
+            end = html.find('"', start)
+            if end < 0:
+                return None
+            if end > start:
+                return html[start:end]
+
+            # Empty value; like the old [^"]+ pattern, move on to the next one
+            start = html.find(marker, end + 1)
+
+        return None
+
     def get_video_upload_date(self, video_id: str) -> Optional[str]:
         """
         Get accurate upload date for a video by scraping the YouTube page
@@ -155,24 +617,13 @@ class YouTubeScraper:
         Returns:
             Upload date in YYYY-MM-DD format or None if not found
         """
-        url = f'https://www.youtube.com/watch?v={video_id}'
-        
         try:
-            req = urllib.request.Request(url, headers={'User-Agent': self.user_agent})
-            with urllib.request.urlopen(req, timeout=10) as response:
-                html = response.read().decode('utf-8')
-            
-            # Search for uploadDate in the page
-            upload_match = re.search(r'"uploadDate":"([^"]+)"', html)
-            if upload_match:
-                full_date = upload_match.group(1)
-                date_only = full_date.split('T')[0]
-                return date_only
+            html = self._fetch_page(f'/watch?v={video_id}', stop_key='uploadDate')
             
-            # Fallback to datePublished
-            date_match = re.search(r'"datePublished":"([^"]+)"', html)
-            if date_match:
-                full_date = date_match.group(1)
+            # Search for uploadDate in the page, falling back to datePublished
+            full_date = (self._find_json_string(html, 'uploadDate')
+                         or self._find_json_string(html, 'datePublished'))
+            if full_date:
                 date_only = full_date.split('T')[0]
                 return date_only
                 
@@ -186,43 +637,79 @@ class YouTubeScraper:
         """
         Process video list to add upload dates
         
+        Videos whose upload date yt-dlp already reported or that are in the
+        date cache are used as is; the rest are fetched concurrently, so the
+        total time is roughly that of the slowest request rather than the sum
+        of all of them.
+        
         Args:
             videos: List of video dictionaries from youtube-dl
             
         Returns:
             List of processed video dictionaries with upload dates
         """
-        processed_videos = []
+        return list(self._iter_processed_videos(videos))
+    
+    def _iter_processed_videos(self, videos: List[Dict]) -> Iterator[Dict]:
+        """
+        Process videos like process_videos, one at a time
         
-        for i, video in enumerate(videos, 1):
-            video_id = video.get('id', '')
-            title = video.get('title', '')
-            
-            print(f"處理影片 {i}/{len(videos)}: {video_id}")
-            
-            # Get upload date
-            upload_date = self.get_video_upload_date(video_id)
-            
-            processed_video = {
-                'title': title,
-                'video_id': video_id,
-                'url': f"https://www.youtube.com/watch?v={video_id}",
-                'view_count': video.get('view_count', 0),
-                'duration': video.get('duration', 0),
-                'upload_date': upload_date or 'Unknown'
-            }
+        The date cache is committed when the generator finishes or is closed,
+        so callers that may stop early should close it.
+        
+        Args:
+            videos: List of video dictionaries from youtube-dl
             
-            processed_videos.append(processed_video)
+        Yields:
+            Processed video dictionaries with upload dates, in playlist order,
+            each as soon as its upload date is known
+        """
+        upload_dates = {video.get('id', ''): video.get('upload_date') for video in videos}
+        
+        for video_id, upload_date in upload_dates.items():
+            if not upload_date:
+                upload_dates[video_id] = self._cached_date(video_id)
+        
+        missing_ids = [video_id for video_id, upload_date in upload_dates.items() if not upload_date]
+        pending_ids = set(missing_ids)
+        
+        if missing_ids:
+            print(f"同時處理 {len(missing_ids)} 部影片的首播日期...")
+        
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+            # map returns results in order, each as soon as it is done
+            fetched_dates = executor.map(self.get_video_upload_date, missing_ids)
             
-        return processed_videos
+            try:
+                for video in videos:
+                    video_id = video.get('id', '')
+                    
+                    if video_id in pending_ids:
+                        pending_ids.discard(video_id)
+                        upload_dates[video_id] = next(fetched_dates)
+                        if upload_dates[video_id]:
+                            self._store_date(video_id, upload_dates[video_id])
+                    
+                    yield {
+                        'title': video.get('title', ''),
+                        'video_id': video_id,
+                        'url': f"https://www.youtube.com/watch?v={video_id}",
+                        'view_count': video.get('view_count', 0),
+                        'duration': video.get('duration', 0),
+                        'upload_date': upload_dates[video_id] or 'Unknown'
+                    }
+            finally:
+                self._commit_date_cache()
     
-    def save_to_csv(self, videos: List[Dict], output_file: str):
+    def save_to_csv(self, videos: Iterable[Dict], output_file: str, flush_each_row: bool = False):
         """
         Save video data to CSV file
         
         Args:
-            videos: List of video dictionaries
+            videos: Video dictionaries, written one by one as they are produced
             output_file: Output CSV file name (will be saved to yt-csv directory)
+            flush_each_row: Flush every row to disk as soon as it is written
+                instead of buffering the file
         """
         # Ensure output file is in yt-csv directory
         if not Path(output_file).is_absolute():
@@ -231,25 +718,30 @@ class YouTubeScraper:
             # If absolute path given, still save to yt-csv directory
             output_path = self.csv_dir / Path(output_file).name
         
-        fieldnames = ['影片標題', '影片ID', '完整連結', '觀看次數', '影片長度(秒)', '首播日期']
+        # CSV header for each processed video field
+        headers = {
+            'title': '影片標題',
+            'video_id': '影片ID',
+            'url': '完整連結',
+            'view_count': '觀看次數',
+            'duration': '影片長度(秒)',
+            'upload_date': '首播日期'
+        }
         
-        with open(output_path, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.writer(csvfile)
+        with open(output_path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
+            # The csv module quotes titles containing commas or quotes itself
+            writer = csv.DictWriter(csvfile, fieldnames=list(headers), extrasaction='ignore')
             
             # Write header
-            writer.writerow(fieldnames)
+            writer.writerow(headers)
             
             # Write data
-            for video in videos:
-                row = [
-                    f'"{video["title"]}"',  # Quote title to handle commas
-                    video['video_id'],
-                    video['url'],
-                    video['view_count'],
-                    video['duration'],
-                    video['upload_date']
-                ]
-                writer.writerow(row)
+            if flush_each_row:
+                for video in videos:
+                    writer.writerow(video)
+                    csvfile.flush()
+            else:
+                writer.writerows(videos)
         
         print(f"資料已儲存到: {output_path}")
     
@@ -272,13 +764,105 @@ class YouTubeScraper:
         videos = self.get_channel_videos(channel_url, count)
         
         # Process videos to add upload dates
-        processed_videos = self.process_videos(videos)
+        if not output_file:
+            return self.process_videos(videos)
         
-        # Save to CSV if output file specified
-        if output_file:
-            self.save_to_csv(processed_videos, output_file)
+        processed_videos = []
+        
+        def collect(processed: Iterable[Dict]) -> Iterator[Dict]:
+            for video in processed:
+                processed_videos.append(video)
+                yield video
+        
+        # Each row is on disk as soon as its upload date is known; the rows are
+        # still kept for the return value
+        with contextlib.closing(self._iter_processed_videos(videos)) as processed:
+            self.save_to_csv(collect(processed), output_file, flush_each_row=True)
         
         return processed_videos
+    
+    def scrape_channels(self, channel_urls: List[str], count: int = 10, save_csv: bool = False) -> Dict[str, List[Dict]]:
+        """
+        Scrape several channels with a single yt-dlp run
+        
+        Args:
+            channel_urls: YouTube channel URLs
+            count: Number of videos to fetch per channel
+            save_csv: Save each channel to <channel name>.csv in the yt-csv directory
+            
+        Returns:
+            Processed video dictionaries for each channel URL; channels that
+            could not be read map to an empty list
+            
+        Raises:
+            ChannelError: When none of the channels could be read
+        """
+        if not channel_urls:
+            return {}
+        
+        print(f"正在抓取 {len(channel_urls)} 個頻道")
+        print(f"每個頻道獲取影片數量: {count}")
+        
+        # yt-dlp may report the tab URL with different case or percent-encoding
+        def channel_key(url: str) -> str:
+            return urllib.parse.unquote(url).rstrip('/').lower()
+        
+        channel_videos = {channel_url: [] for channel_url in channel_urls}
+        videos_by_key = {
+            channel_key(f"{channel_url}/videos"): videos
+            for channel_url, videos in channel_videos.items()
+        }
+        # Videos whose tab URL matched none of the requested channels, by tab URL
+        unmatched = {}
+        
+        def handle_line(line: str):
+            # Each line is prefixed with the channel tab it came from
+            playlist_url, _, video_line = line.partition('\t')
+            video_data = self._parse_video_line(video_line)
+            if not video_data:
+                return
+            videos = videos_by_key.get(channel_key(playlist_url))
+            if videos is not None:
+                videos.append(video_data)
+            else:
+                unmatched[playlist_url] = unmatched.get(playlist_url, 0) + 1
+        
+        # --ignore-errors lets one bad channel not stop the rest
+        cmd = [
+            self.ytdlp_path, '--flat-playlist', '--encoding', 'utf-8', '--ignore-errors',
+            '--playlist-end', str(count),
+            '-O', '%(playlist_webpage_url)s\t' + self._VIDEO_TEMPLATE,
+            *(f"{channel_url}/videos" for channel_url in channel_videos)
+        ]
+        returncode, stderr = self._run_ytdlp(cmd, handle_line, timeout=self.YTDLP_TIMEOUT * len(channel_videos))
+        
+        for playlist_url, video_count in unmatched.items():
+            print(f"無法對應到要求的頻道，已略過 {video_count} 部影片: {playlist_url}")
+        
+        all_channels = ', '.join(channel_videos)
+        if not any(channel_videos.values()):
+            if unmatched:
+                raise ChannelError(f"無法將 yt-dlp 輸出的影片對應到頻道: {all_channels}", "parse_error")
+            if returncode != 0:
+                raise self._channel_error(stderr, all_channels)
+            raise ChannelError(f"頻道沒有任何影片或頻道不存在: {all_channels}", "no_videos")
+        
+        # Fetch missing upload dates for all channels in one pass; each channel
+        # is ready once its own videos are done
+        results = {}
+        with contextlib.closing(self._iter_processed_videos(
+            [video for videos in channel_videos.values() for video in videos]
+        )) as processed_videos:
+            for channel_url, videos in channel_videos.items():
+                results[channel_url] = [next(processed_videos) for _ in videos]
+                
+                if not videos:
+                    print(f"無法獲取頻道影片: {channel_url}")
+                elif save_csv:
+                    channel_name = channel_url.rstrip('/').rsplit('/', 1)[-1].lstrip('@')
+                    self.save_to_csv(results[channel_url], f"{urllib.parse.unquote(channel_name)}.csv")
+        
+        return results
 
 
 def main():
@@ -403,6 +987,8 @@ def main():
     except Exception as e:
         print(f"執行時發生未預期錯誤: {e}")
         sys.exit(1)
+    finally:
+        scraper.close()
 
 
 if __name__ == "__main__":